@@ -4,22 +4,29 @@ UNDP Jobs Scraper — crawls listing pages at jobs.undp.org,
 extracts Oracle Cloud job links, filters STRICTLY for D/P professional
 levels only, and produces a valid RSS 2.0 feed (undp_jobs.xml).
 
-NO Selenium.  Dependencies: requests, beautifulsoup4, lxml.
+NO Selenium.  Dependencies: requests, lxml.
 """
 
 import hashlib
+import json
 import re
 import sys
-import time
 import unicodedata
-import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import format_datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.builder import ElementMaker
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -29,12 +36,21 @@ MAX_ITEMS = 200
 FAIL_IF_ZERO_ITEMS = True       # exit non-zero AFTER writing RSS
 HARD_PAGE_CAP = 25              # max listing pages to crawl
 RAW_LINK_BUFFER = 1200          # stop paging once we have this many unique job links
+CRAWL_WORKERS = 8               # listing pages fetched in parallel
 OUTPUT_FILE = Path(__file__).resolve().parent / "undp_jobs.xml"
+HTTP_CACHE_DIR = Path(__file__).resolve().parent / ".http_cache"   # conditional-GET bodies
+HTTP_CACHE_INDEX = HTTP_CACHE_DIR / "index.json"
 FEED_URL = "https://cinfoposte.github.io/undp-jobs/undp_jobs.xml"
+ATOM_NS = "http://www.w3.org/2005/Atom"
 
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 3
-RETRY_WAITS = [1, 3, 7]        # seconds between retries
+RETRY_BACKOFF = 1               # urllib3 backoff factor (exponential waits)
+RETRY_STATUSES = (500, 502, 503, 504)
+POOL_CONNECTIONS = 4            # distinct hosts kept in the connection pool
+POOL_MAXSIZE = 16               # keep-alive connections per host
+MAX_PAGE_BYTES = 4 * 1024 * 1024   # refuse listing pages larger than this
+HTML_CONTENT_TYPES = ("text/", "application/xhtml")
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -43,179 +59,377 @@ USER_AGENT = (
 )
 
 # Oracle Cloud URL fragments that identify job links
-ORACLE_FRAGMENTS = [
+ORACLE_FRAGMENTS = (
     "estm.fa.em2.oraclecloud.com",
     "oraclecloud.com",
     "/hcmUI/",
     "CandidateExperience",
-]
+)
+_RE_ORACLE = re.compile("|".join(map(re.escape, ORACLE_FRAGMENTS)))
+
+# Substring (lower-cased) that identifies a UNDP listing page link
+LISTING_PAGE_MARKER = "cj_view_jobs.cfm"
 
 # ---------------------------------------------------------------------------
 # HTTP session
 # ---------------------------------------------------------------------------
+_RE_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
 session = requests.Session()
 session.headers.update({
     "User-Agent": USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
+    # gzip/deflate, plus br when brotli is installed (urllib3 decodes it)
+    "Accept-Encoding": urllib3.util.make_headers(accept_encoding=True)["accept-encoding"],
     "Connection": "keep-alive",
 })
+_adapter = HTTPAdapter(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=POOL_MAXSIZE,
+    pool_block=True,            # wait for a pooled connection, never open throwaway ones
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        # Backoff only: a maintenance 503 with a long Retry-After must not
+        # stall the workers (urllib3 would honour up to 6 h per retry)
+        respect_retry_after_header=False,
+    ),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
 
 
-def fetch(url: str) -> requests.Response | None:
-    """GET with retries and backoff."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = session.get(url, timeout=REQUEST_TIMEOUT)
-            if resp.status_code != 200:
+def response_charset(resp: requests.Response) -> str | None:
+    """Charset declared in the Content-Type header, if any."""
+    m = _RE_CHARSET.search(resp.headers.get("Content-Type", ""))
+    return m.group(1).lower() if m else None
+
+
+# ---------------------------------------------------------------------------
+# Cross-run HTTP cache (conditional GET with ETag / Last-Modified)
+# ---------------------------------------------------------------------------
+# url -> {"etag", "last_modified", "charset", "body"}; "body" is a file
+# name inside HTTP_CACHE_DIR.  Worker threads only touch their own URL.
+_http_cache: dict[str, dict] = {}
+_http_cache_used: set[str] = set()
+
+
+def load_http_cache() -> None:
+    """Load the cache index written by a previous run, if any."""
+    try:
+        _http_cache.update(json.loads(HTTP_CACHE_INDEX.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return
+    print(f"  HTTP cache: {len(_http_cache)} entries loaded from {HTTP_CACHE_DIR}")
+
+
+def _drop_cached_body(entry: dict) -> None:
+    """Delete an evicted entry's body file; housekeeping never fails the run."""
+    try:
+        (HTTP_CACHE_DIR / entry["body"]).unlink(missing_ok=True)
+    except OSError as exc:
+        print(f"  [WARN] Could not delete cached body {entry['body']}: {exc}")
+
+
+def save_http_cache() -> None:
+    """Persist the index, dropping entries (and bodies) not used this run."""
+    for url in list(_http_cache):
+        if url not in _http_cache_used:
+            _drop_cached_body(_http_cache.pop(url))
+    try:
+        HTTP_CACHE_DIR.mkdir(exist_ok=True)
+        HTTP_CACHE_INDEX.write_text(json.dumps(_http_cache, indent=1), encoding="utf-8")
+    except OSError as exc:
+        print(f"  [WARN] Could not write HTTP cache index: {exc}")
+
+
+def _cache_response(url: str, resp: requests.Response, body: bytes) -> None:
+    """Remember a 200 response that carries a validator."""
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        stale = _http_cache.pop(url, None)
+        if stale:
+            _drop_cached_body(stale)
+        return
+    body_file = hashlib.blake2b(url.encode(), digest_size=16).hexdigest() + ".html"
+    try:
+        HTTP_CACHE_DIR.mkdir(exist_ok=True)
+        (HTTP_CACHE_DIR / body_file).write_bytes(body)
+    except OSError as exc:
+        print(f"  [WARN] Could not cache {url}: {exc}")
+        return
+    _http_cache[url] = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "charset": response_charset(resp),
+        "body": body_file,
+    }
+
+
+def _read_html_body(url: str, resp: requests.Response) -> bytes | None:
+    """
+    Read a streamed response body, refusing non-HTML content types and
+    bodies larger than MAX_PAGE_BYTES (checked before and while reading).
+    """
+    content_type = resp.headers.get("Content-Type", "")
+    if content_type and not content_type.lower().startswith(HTML_CONTENT_TYPES):
+        print(f"  [WARN] Skipping non-HTML response ({content_type}) for {url}")
+        return None
+    length = resp.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > MAX_PAGE_BYTES:
+        print(f"  [WARN] Skipping oversized response ({length} bytes) for {url}")
+        return None
+    # Decompressed once by urllib3; never more than MAX_PAGE_BYTES + 1 in memory
+    body = resp.raw.read(MAX_PAGE_BYTES + 1, decode_content=True)
+    if len(body) > MAX_PAGE_BYTES:
+        print(f"  [WARN] Skipping response larger than {MAX_PAGE_BYTES} bytes for {url}")
+        return None
+    return body
+
+
+def fetch(url: str) -> tuple[int, bytes, str | None] | None:
+    """
+    Streamed GET through the pooled session (retries/backoff handled by the
+    adapter), revalidating against the cross-run HTTP cache.
+    Returns (status, body, charset); a 304 is answered from the cache.
+    """
+    _http_cache_used.add(url)
+    entry = _http_cache.get(url)
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+            if resp.status_code not in (200, 304):
                 print(f"  [WARN] HTTP {resp.status_code} for {url}")
             resp.raise_for_status()
-            return resp
-        except requests.RequestException as exc:
-            wait = RETRY_WAITS[attempt] if attempt < len(RETRY_WAITS) else 7
-            print(f"  [RETRY {attempt+1}/{MAX_RETRIES}] {url} — {exc} — waiting {wait}s")
-            time.sleep(wait)
-    print(f"  [ERROR] All {MAX_RETRIES} attempts failed for {url}")
-    return None
+            if resp.status_code == 304 and entry:
+                body = None
+            else:
+                body = _read_html_body(url, resp)
+                if body is None:
+                    return None
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as exc:
+        print(f"  [ERROR] Request failed for {url} — {exc}")
+        return None
+
+    if body is None:
+        try:
+            return 304, (HTTP_CACHE_DIR / entry["body"]).read_bytes(), entry["charset"]
+        except OSError:
+            # Cached body vanished: forget the entry and fetch unconditionally
+            del _http_cache[url]
+            return fetch(url)
+
+    if resp.status_code == 200:
+        _cache_response(url, resp, body)
+    return resp.status_code, body, response_charset(resp)
 
 
 # ---------------------------------------------------------------------------
 # Text helpers
 # ---------------------------------------------------------------------------
 
+# Dash-like code points (hyphens, en/em dashes, minus signs) -> "-"
+_DASH_TABLE = dict.fromkeys(
+    [*range(0x2010, 0x2016), 0x2212, 0xFE58, 0xFE63, 0xFF0D], ord("-")
+)
+# Characters illegal in XML 1.0 (C0 controls except tab/LF/CR, DEL, C1 except
+# NEL, surrogates, U+FFFE/U+FFFF) -- everything lxml refuses to serialize
+_XML_ILLEGAL_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20),
+     *range(0x7F, 0x85), *range(0x86, 0xA0),
+     *range(0xD800, 0xE000), 0xFFFE, 0xFFFF]
+)
+
+_RE_WS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
-    """Uppercase, normalize dashes, collapse whitespace."""
-    t = unicodedata.normalize("NFKC", text).upper()
-    t = re.sub(r"[\u2010-\u2015\u2212\uFE58\uFE63\uFF0D]", "-", t)
-    t = re.sub(r"\s+", " ", t).strip()
+    """Uppercase, normalize dashes, collapse whitespace (memoized)."""
+    if text.isascii():
+        # ASCII is NFKC-stable and holds no dash variants: skip both passes
+        t = text.upper()
+    else:
+        t = unicodedata.normalize("NFKC", text).upper().translate(_DASH_TABLE)
+    t = _RE_WS.sub(" ", t).strip()
     return t
 
 
 def strip_xml_illegal(text: str) -> str:
     """Remove characters illegal in XML 1.0."""
-    return re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f]", "", text)
+    return text.translate(_XML_ILLEGAL_TABLE)
 
 
 # ---------------------------------------------------------------------------
 # STEP 3 — STRICT D/P detection
 # ---------------------------------------------------------------------------
 
-_RE_D = re.compile(r"\bD\s*[-]?\s*(1|2)\b")
-_RE_P = re.compile(r"\bP\s*[-]?\s*([1-6])\b")
-
-# Exclusion patterns (belt-and-suspenders)
-_EXCLUDE_STRINGS = ["IPSA", "NPSA"]
-_EXCLUDE_KEYWORDS = ["INTERN", "INTERNSHIP", "FELLOW", "FELLOWSHIP",
-                     "CONSULTANT", "CONSULTANCY"]
-_RE_NO = re.compile(r"\bNO\s*[-]?\s*[A-D]\b")
-_RE_G = re.compile(r"\bG\s*[-]?\s*[1-7]\b")
-_EXCLUDE_PREFIXES = ["SB-", "LSC-"]
-
-
-def detect_level(text: str) -> str:
-    """
-    Return one of D1, D2, P1..P6 if found in text, else "".
-    Prefers D over P if both appear.
-    """
-    norm = normalize_text(text)
-    m = _RE_D.search(norm)
-    if m:
-        return f"D{m.group(1)}"
-    m = _RE_P.search(norm)
-    if m:
-        return f"P{m.group(1)}"
-    return ""
+_D_LEVEL = r"\bD\s*-?\s*[12]\b"
+_P_LEVEL = r"\bP\s*-?\s*[1-6]\b"
 
+# Exclusion patterns (belt-and-suspenders):
+#   IPSA / NPSA, intern(ship), fellow(ship), consultant/consultancy and the
+#   SB- / LSC- prefixes match anywhere; NO-A..NO-D and G-1..G-7 are whole tokens.
+_EXCLUDE = (
+    r"IPSA|NPSA|INTERN|FELLOW|CONSULTAN(?:T|CY)|SB-|LSC-"
+    r"|\bNO\s*-?\s*[A-D]\b|\bG\s*-?\s*[1-7]\b"
+)
 
-def is_excluded(norm_text: str) -> bool:
-    """Return True if text trips the exclusion belt."""
-    for s in _EXCLUDE_STRINGS:
-        if s in norm_text:
-            return True
-    for kw in _EXCLUDE_KEYWORDS:
-        if kw in norm_text:
-            return True
-    if _RE_NO.search(norm_text):
-        return True
-    if _RE_G.search(norm_text):
-        return True
-    for pref in _EXCLUDE_PREFIXES:
-        if pref in norm_text:
-            return True
-    return False
+# Level and exclusion tokens in one alternation, so a blob is classified
+# in a single scan.  None of the exclusion tokens can start inside a level
+# token (or vice versa), so non-overlapping matching misses nothing.
+_RE_CLASSIFY = re.compile(
+    rf"(?P<excl>{_EXCLUDE})|(?P<D>{_D_LEVEL})|(?P<P>{_P_LEVEL})"
+)
 
 
 def should_include(text: str) -> tuple[bool, str]:
     """
     Return (include, level) where level is e.g. "P3" or "D1".
     Include ONLY if a D/P level is detected AND no exclusion trips.
+    Prefers D over P if both appear.
     """
-    norm = normalize_text(text)
-    level = detect_level(text)
-    if not level:
-        return False, ""
-    if is_excluded(norm):
-        return False, ""
-    return True, level
+    d_level = p_level = ""
+    for m in _RE_CLASSIFY.finditer(normalize_text(text)):
+        kind = m.lastgroup
+        if kind == "excl":
+            return False, ""
+        if kind == "D":
+            d_level = d_level or f"D{m.group()[-1]}"
+        else:
+            p_level = p_level or f"P{m.group()[-1]}"
+    level = d_level or p_level
+    return bool(level), level
 
 
 # ---------------------------------------------------------------------------
 # STEP 1 — Discover and crawl listing pages (queue crawl)
 # ---------------------------------------------------------------------------
 
-def is_listing_page_url(href: str) -> bool:
-    """Check if href looks like a UNDP listing page."""
-    return "cj_view_jobs.cfm" in href.lower()
+_PARENT_TAGS = ("tr", "li", "div")   # preference order for row text
+
+_NO_TEXT_TAGS = frozenset(("script", "style"))
 
 
-def extract_job_links_and_pagination(html: str, page_url: str):
+def _iter_text(el):
+    """
+    Lazily yield el's visible text nodes in document order (script/style
+    bodies and comments excluded; el's own tail is outside it).
     """
-    From a listing page, extract:
+    for event, node in etree.iterwalk(el, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if node.text and node.tag not in _NO_TEXT_TAGS:
+                yield node.text
+        elif node.tail and node is not el:
+            yield node.tail
+
+
+def element_text(el, limit: int | None = None) -> str:
+    """
+    Stripped, non-empty text nodes of el joined by single spaces.
+    With `limit`, stops walking once that many characters are collected
+    and returns at most `limit` characters.
+    """
+    parts: list[str] = []
+    size = 0
+    for text in _iter_text(el):
+        text = text.strip()
+        if text:
+            parts.append(text)
+            size += len(text) + 1
+            if limit is not None and size > limit:
+                break
+    joined = " ".join(parts)
+    return joined if limit is None else joined[:limit]
+
+
+def _parent_text(a, row_texts: dict) -> str:
+    """
+    Text of the anchor's nearest <tr>, else <li>, else <div> ancestor
+    (first non-empty one in that order), truncated to 800 chars.
+    Ancestors are walked once instead of once per tag name, and each
+    container's text is extracted once per page via `row_texts`
+    (element -> text), however many job anchors it holds.
+    """
+    nearest: dict[str, object] = {}
+    for parent in a.iterancestors(*_PARENT_TAGS):
+        nearest.setdefault(parent.tag, parent)
+        if len(nearest) == len(_PARENT_TAGS):
+            break
+    for tag in _PARENT_TAGS:
+        parent = nearest.get(tag)
+        if parent is not None:
+            candidate = row_texts.get(parent)
+            if candidate is None:
+                candidate = row_texts[parent] = element_text(parent, limit=800)
+            if candidate:
+                return candidate
+    return ""
+
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: str | None) -> lxml_html.HTMLParser | None:
+    """HTML parser forced to `encoding`; None lets lxml sniff BOM / <meta charset>."""
+    if not encoding:
+        return None
+    try:
+        return lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:
+        return None
+
+
+def extract_job_links_and_pagination(html: bytes, page_url: str,
+                                     encoding: str | None = None):
+    """
+    From a listing page body (raw bytes, decoded once by lxml), extract
+    in a single pass over the anchors:
       - oracle cloud job links with text blobs
       - pagination links (other listing pages)
     """
-    soup = BeautifulSoup(html, "lxml")
-    all_anchors = soup.find_all("a", href=True)
+    job_links: dict[str, str] = {}  # url -> text_blob
+    pagination_links: list[str] = []
+    row_texts: dict = {}            # container element -> text (per page)
+    try:
+        tree = lxml_html.document_fromstring(html, parser=_html_parser(encoding))
+    except etree.ParserError as exc:
+        print(f"  [WARN] Could not parse {page_url}: {exc}")
+        return job_links, pagination_links
+    all_anchors = tree.xpath("//a[@href]")
     print(f"  Page {page_url}: {len(all_anchors)} <a> tags found")
 
-    # --- Job links (Oracle Cloud) ---
-    job_links: dict[str, str] = {}  # url -> text_blob
     for a in all_anchors:
-        href = a["href"]
-        if not any(frag in href for frag in ORACLE_FRAGMENTS):
+        href = a.get("href")
+
+        # --- Pagination links ---
+        if LISTING_PAGE_MARKER in href.lower():
+            # Fragments never reach the server: "#top" variants are the same page
+            abs_url = urljoin(page_url, href).partition("#")[0]
+            # Skip if it's the same as current page
+            if abs_url != page_url:
+                pagination_links.append(abs_url)
+
+        # --- Job links (Oracle Cloud) ---
+        if not _RE_ORACLE.search(href):
             continue
         job_url = urljoin(page_url, href)
+        if job_url in job_links:
+            continue
 
-        # Best available text
-        anchor_text = a.get_text(" ", strip=True)
-
-        # Try parent elements for richer text
-        parent_text = ""
-        for parent_tag in ["tr", "li", "div"]:
-            parent = a.find_parent(parent_tag)
-            if parent:
-                candidate = parent.get_text(" ", strip=True)
-                if candidate and len(candidate) > len(parent_text):
-                    parent_text = candidate[:800]
-                    break
-
-        # Choose longest non-empty text
-        text_blob = anchor_text
-        if parent_text and len(parent_text) > len(text_blob):
+        # Choose longest non-empty text: anchor text vs. enclosing row text
+        text_blob = element_text(a)
+        parent_text = _parent_text(a, row_texts)
+        if len(parent_text) > len(text_blob):
             text_blob = parent_text
 
-        if job_url not in job_links:
-            job_links[job_url] = text_blob
-
-    # --- Pagination links ---
-    pagination_links: list[str] = []
-    for a in all_anchors:
-        href = a["href"]
-        if is_listing_page_url(href):
-            abs_url = urljoin(page_url, href)
-            # Skip if it's the same as current page
-            if urlparse(abs_url).geturl() != urlparse(page_url).geturl():
-                pagination_links.append(abs_url)
+        job_links[job_url] = text_blob
 
     print(f"  OracleCloud job links on this page: {len(job_links)}")
     print(f"  Pagination links discovered: {len(pagination_links)}")
@@ -225,53 +439,73 @@ def extract_job_links_and_pagination(html: str, page_url: str):
 
 def crawl_listing_pages() -> dict[str, str]:
     """
-    Queue-based crawl of listing pages.
+    Queue-based crawl of listing pages, fetched in concurrent waves.
+    Each wave downloads the pending queue (up to the page cap) in parallel;
+    pages are then parsed on the main thread in queue order so the result
+    matches a sequential breadth-first crawl.
     Returns dict of job_url -> text_blob (de-duped).
     """
-    queue: list[str] = [LISTING_URL]
+    queue: deque[str] = deque([LISTING_URL])
+    queued: set[str] = {LISTING_URL}   # every URL ever enqueued (O(1) dedupe)
     visited: set[str] = set()
     all_job_links: dict[str, str] = {}
     pages_fetched = 0
     first_page = True
 
+    load_http_cache()
     print(f"=== Starting crawl from {LISTING_URL}")
-    print(f"    HARD_PAGE_CAP={HARD_PAGE_CAP}, RAW_LINK_BUFFER={RAW_LINK_BUFFER}")
-
-    while queue and pages_fetched < HARD_PAGE_CAP and len(all_job_links) < RAW_LINK_BUFFER:
-        url = queue.pop(0)
-        if url in visited:
-            continue
-        visited.add(url)
-
-        resp = fetch(url)
-        if not resp:
-            continue
-        pages_fetched += 1
-        print(f"\n--- Listing page {pages_fetched}: status={resp.status_code} url={url}")
-
-        job_links, pagination_links = extract_job_links_and_pagination(resp.text, url)
-
-        # Debug: first page only — print sample links
-        if first_page:
-            first_page = False
-            print(f"\n  [DEBUG] Total oraclecloud links on first page: {len(job_links)}")
-            for i, (jurl, jtxt) in enumerate(list(job_links.items())[:10]):
-                print(f"    [{i+1}] {jurl}")
-                print(f"        text: {jtxt[:120]}...")
-
-        # Merge job links
-        for jurl, jtxt in job_links.items():
-            if jurl not in all_job_links:
-                all_job_links[jurl] = jtxt
-
-        # Add pagination links to queue
-        for purl in pagination_links:
-            if purl not in visited:
-                queue.append(purl)
-
-        print(f"  Global: pages_fetched={pages_fetched}, queue_len={len(queue)}, "
-              f"visited={len(visited)}, raw_unique_job_links={len(all_job_links)}")
-
+    print(f"    HARD_PAGE_CAP={HARD_PAGE_CAP}, RAW_LINK_BUFFER={RAW_LINK_BUFFER}, "
+          f"CRAWL_WORKERS={CRAWL_WORKERS}")
+
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+        while queue and pages_fetched < HARD_PAGE_CAP and len(all_job_links) < RAW_LINK_BUFFER:
+            # Take the next wave of unvisited URLs off the front of the queue
+            wave: list[str] = []
+            while queue and len(wave) < HARD_PAGE_CAP - pages_fetched:
+                url = queue.popleft()
+                visited.add(url)
+                wave.append(url)
+
+            futures = [executor.submit(fetch, url) for url in wave]
+            for url, future in zip(wave, futures):
+                if len(all_job_links) >= RAW_LINK_BUFFER:
+                    # Enough links: drop the fetches that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                page = future.result()
+                if not page:
+                    continue
+                status, body, charset = page
+                pages_fetched += 1
+                print(f"\n--- Listing page {pages_fetched}: status={status} url={url}")
+
+                job_links, pagination_links = extract_job_links_and_pagination(
+                    body, url, charset)
+
+                # Debug: first page only — print sample links
+                if first_page:
+                    first_page = False
+                    print(f"\n  [DEBUG] Total oraclecloud links on first page: {len(job_links)}")
+                    for i, (jurl, jtxt) in enumerate(list(job_links.items())[:10]):
+                        print(f"    [{i+1}] {jurl}")
+                        print(f"        text: {jtxt[:120]}...")
+
+                # Merge job links
+                for jurl, jtxt in job_links.items():
+                    if jurl not in all_job_links:
+                        all_job_links[jurl] = jtxt
+
+                # Add pagination links to queue
+                for purl in pagination_links:
+                    if purl not in queued:
+                        queued.add(purl)
+                        queue.append(purl)
+
+                print(f"  Global: pages_fetched={pages_fetched}, queue_len={len(queue)}, "
+                      f"visited={len(visited)}, raw_unique_job_links={len(all_job_links)}")
+
+    save_http_cache()
     print(f"\n=== Crawl finished: {pages_fetched} pages, {len(all_job_links)} unique job links")
     return all_job_links
 
@@ -281,42 +515,36 @@ def crawl_listing_pages() -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 _LABELS = ["Job Title", "Post level", "Apply by", "Agency", "Location"]
+_RE_LABEL = re.compile("|".join(map(re.escape, _LABELS)), re.IGNORECASE)
+_LABEL_FIELDS = {
+    "job title": "title",
+    "apply by": "apply_by",
+    "agency": "agency",
+    "location": "location",
+}
 
 
 def parse_fields(text_blob: str) -> dict:
     """
     Try to parse title, apply_by, agency, location from text_blob
-    using label slicing between known labels.
+    using label slicing between known labels.  Values are stripped.
     """
     fields = {"title": "", "apply_by": "", "agency": "", "location": ""}
 
-    # Try label-based slicing
-    upper = text_blob.upper()
-    positions: list[tuple[int, str]] = []
-    for label in _LABELS:
-        idx = upper.find(label.upper())
-        if idx >= 0:
-            positions.append((idx, label))
-    positions.sort()
-
-    if positions:
-        for i, (pos, label) in enumerate(positions):
-            start = pos + len(label)
-            # skip any separator chars
-            while start < len(text_blob) and text_blob[start] in " :\t":
-                start += 1
-            end = positions[i + 1][0] if i + 1 < len(positions) else len(text_blob)
-            value = text_blob[start:end].strip()
-
-            lbl = label.lower()
-            if "title" in lbl:
-                fields["title"] = value
-            elif "apply" in lbl:
-                fields["apply_by"] = value
-            elif "agency" in lbl:
-                fields["agency"] = value
-            elif "location" in lbl:
-                fields["location"] = value
+    # Label-based slicing: first occurrence of each label, in text order
+    first: dict[str, tuple[int, int]] = {}
+    for m in _RE_LABEL.finditer(text_blob):
+        first.setdefault(m.group().lower(), m.span())
+    positions = sorted((pos, end, label) for label, (pos, end) in first.items())
+
+    for i, (_, start, label) in enumerate(positions):
+        # skip any separator chars
+        while start < len(text_blob) and text_blob[start] in " :\t":
+            start += 1
+        end = positions[i + 1][0] if i + 1 < len(positions) else len(text_blob)
+        key = _LABEL_FIELDS.get(label)
+        if key:
+            fields[key] = text_blob[start:end].strip()
 
     # Fallback for title: use first reasonable segment of text
     if not fields["title"]:
@@ -338,84 +566,71 @@ def parse_fields(text_blob: str) -> dict:
 
 def generate_guid(job_url: str) -> str:
     """Stable 16-digit numeric GUID derived from md5 of the URL."""
-    md5hex = hashlib.md5(job_url.encode()).hexdigest()
+    md5hex = hashlib.md5(job_url.encode(), usedforsecurity=False).hexdigest()
     n = int(md5hex, 16) % (10 ** 16)
     return f"{n:016d}"
 
 
-def xml_escape(text: str) -> str:
-    """Escape text for XML content."""
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    text = text.replace('"', "&quot;")
-    text = text.replace("'", "&apos;")
-    return text
+# RSS element factory; declares the atom prefix used for the self link
+E = ElementMaker(nsmap={"atom": ATOM_NS})
 
 
-def build_rss(items: list[dict]) -> str:
+def build_rss(items: list[dict]) -> etree._ElementTree:
     """
-    Build a valid RSS 2.0 XML string.
+    Build a valid RSS 2.0 document as an lxml tree (lxml escapes text and
+    serializes in C when the tree is written).
     Each item dict has: job_url, level, title, apply_by, agency, location
+    (text fields already stripped, as returned by parse_fields).
     """
     now_rfc2822 = format_datetime(datetime.now(timezone.utc))
 
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">',
-        '  <channel>',
-        '    <title>UNDP Jobs (filtered: D/P only)</title>',
-        f'    <link>{LISTING_URL}</link>',
-        '    <description>Only D1\u2013D2 and P1\u2013P6 jobs. Everything else excluded.</description>',
-        '    <language>en</language>',
-        f'    <lastBuildDate>{now_rfc2822}</lastBuildDate>',
-        f'    <atom:link href="{FEED_URL}" rel="self" type="application/rss+xml" />',
-    ]
-
+    rss_items = []
     for item in items[:MAX_ITEMS]:
         job_url = item["job_url"]
         level = item["level"]
-        title = item.get("title", "").strip()
-        location = item.get("location", "").strip()
-        apply_by = item.get("apply_by", "").strip()
-        agency = item.get("agency", "").strip()
-
-        # Build display title: title [LEVEL] — location
-        parts = []
-        if title:
-            parts.append(title)
-        parts.append(f"[{level}]")
-        if location:
-            parts.append(f"\u2014 {location}")
-        display_title = " ".join(parts)
-
-        # Build description as HTML-escaped lines
-        desc_lines = []
-        desc_lines.append(f"Level: {level}")
-        if apply_by:
-            desc_lines.append(f"Apply by: {apply_by}")
-        if agency:
-            desc_lines.append(f"Agency: {agency}")
-        if location:
-            desc_lines.append(f"Location: {location}")
-        desc_lines.append(f"Link: {job_url}")
-        description = "<br/>".join(desc_lines)
-
-        guid = generate_guid(job_url)
-
-        lines.append('    <item>')
-        lines.append(f'      <title>{xml_escape(strip_xml_illegal(display_title))}</title>')
-        lines.append(f'      <link>{xml_escape(job_url)}</link>')
-        lines.append(f'      <guid isPermaLink="false">{guid}</guid>')
-        lines.append(f'      <pubDate>{now_rfc2822}</pubDate>')
-        lines.append(f'      <description>{xml_escape(strip_xml_illegal(description))}</description>')
-        lines.append('    </item>')
-
-    lines.append('  </channel>')
-    lines.append('</rss>')
-    lines.append('')
-
-    return "\n".join(lines)
+        title = item["title"]
+        location = item["location"]
+        apply_by = item["apply_by"]
+        agency = item["agency"]
+
+        # Display title: title [LEVEL] — location
+        display_title = (f"{title} " if title else "") + f"[{level}]" + (
+            f" \u2014 {location}" if location else "")
+
+        # Description as HTML lines (escaped as text by lxml)
+        description = "<br/>".join(line for line in (
+            f"Level: {level}",
+            apply_by and f"Apply by: {apply_by}",
+            agency and f"Agency: {agency}",
+            location and f"Location: {location}",
+            f"Link: {job_url}",
+        ) if line)
+
+        try:
+            rss_items.append(E.item(
+                E.title(strip_xml_illegal(display_title)),
+                E.link(strip_xml_illegal(job_url)),
+                E.guid(generate_guid(job_url), isPermaLink="false"),
+                E.pubDate(now_rfc2822),
+                E.description(strip_xml_illegal(description)),
+            ))
+        except ValueError as exc:
+            # One unserializable posting must not cost the whole feed
+            print(f"  [WARN] Skipping item {job_url!r}: {exc}")
+
+    rss = E.rss(
+        E.channel(
+            E.title("UNDP Jobs (filtered: D/P only)"),
+            E.link(LISTING_URL),
+            E.description("Only D1\u2013D2 and P1\u2013P6 jobs. Everything else excluded."),
+            E.language("en"),
+            E.lastBuildDate(now_rfc2822),
+            E(f"{{{ATOM_NS}}}link", href=FEED_URL, rel="self", type="application/rss+xml"),
+            *rss_items,
+        ),
+        version="2.0",
+    )
+    return etree.ElementTree(rss)
 
 
 # ---------------------------------------------------------------------------
@@ -436,32 +651,16 @@ def main() -> None:
     for job_url, text_blob in raw_jobs.items():
         inc, level = should_include(text_blob)
         if inc:
-            fields = parse_fields(text_blob)
-            included.append({
-                "job_url": job_url,
-                "level": level,
-                "title": fields["title"],
-                "apply_by": fields["apply_by"],
-                "agency": fields["agency"],
-                "location": fields["location"],
-            })
+            included.append({"job_url": job_url, "level": level,
+                             **parse_fields(text_blob)})
         else:
             excluded_count += 1
 
     # Step 5: Generate RSS
-    rss_xml = build_rss(included)
+    rss_tree = build_rss(included)
 
-    # Validate XML well-formedness
-    try:
-        ET.fromstring(rss_xml)
-        print("\n[OK] RSS XML is well-formed.")
-    except ET.ParseError as exc:
-        print(f"\n[ERROR] Generated XML is NOT well-formed: {exc}")
-        # Still write it so we can debug
-        print(rss_xml[:2000])
-
-    # Write RSS file
-    OUTPUT_FILE.write_text(rss_xml, encoding="utf-8")
+    # Write RSS file (well-formed by construction)
+    rss_tree.write(OUTPUT_FILE, xml_declaration=True, encoding="UTF-8", pretty_print=True)
     print(f"\n[OK] Wrote RSS to {OUTPUT_FILE}")
 
     # Step 6: Summary